@@ -4,28 +4,38 @@ Projects API endpoints.
 
 import os
 import uuid
+from pathlib import Path
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_db
+from app.api.upload import check_upload_size
+from app.database import get_db, save
 from app.models.project import Project
+from app.models.transcript import Transcript
+from app.schemas.project import ProjectResponse
+from app.services.storage import copy_to_path
 
 router = APIRouter()
 
+# Columns needed by the project list; skips ORM hydration of full rows
+LIST_COLUMNS = tuple(getattr(Project, field) for field in ProjectResponse.model_fields)
+
 UPLOAD_DIR = "./uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
 @router.get("/")
 def list_projects(db: Session = Depends(get_db)):
-    projects = db.query(Project).all()
-    return projects
+    rows = db.execute(select(*LIST_COLUMNS))
+    return [ProjectResponse.from_orm_trusted(row) for row in rows]
 
 
 @router.get("/{project_id}")
 def get_project(project_id: str, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -39,16 +49,15 @@ async def create_project(
     db: Session = Depends(get_db)
 ):
     """Upload video and create project."""
+    check_upload_size(file)
     
     # Generate unique filename
-    file_ext = os.path.splitext(file.filename)[1] or ".mp4"
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
+    file_ext = Path(file.filename).suffix or ".mp4"
+    unique_filename = f"{uuid.uuid4().hex}{file_ext}"
     file_path = os.path.join(UPLOAD_DIR, unique_filename)
     
     # Save file
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    await run_in_threadpool(copy_to_path, file.file, file_path)
     
     # Create project
     project = Project(
@@ -59,9 +68,7 @@ async def create_project(
         language=language,
     )
     
-    db.add(project)
-    db.commit()
-    db.refresh(project)
+    await run_in_threadpool(save, db, project)
     
     return {
         "id": project.id,
@@ -76,9 +83,11 @@ async def create_project(
 
 @router.delete("/{project_id}")
 def delete_project(project_id: str, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    # Transcripts reference the project, so they have to go first
+    db.execute(delete(Transcript).where(Transcript.project_id == project_id))
     db.delete(project)
     db.commit()
     return {"status": "deleted"}
@@ -2,73 +2,61 @@
 Video rendering API endpoints.
 """
 
-import os
-import sys
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import FileResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.project import Project
-from app.services.video import render_video_with_captions
-
-# Add caption_engine to path
-sys.path.insert(0, '/workspaces/subnow')
-from caption_engine import generate_ass
+from app.models.project import Project, ProjectStatus
+from app.tasks.render import render_video_task
 
 router = APIRouter()
 
-@router.post("/{project_id}/render")
+@router.post("/{project_id}/render", status_code=202)
 def start_render(
     project_id: str,
     theme_id: str = "hormozi",
     db: Session = Depends(get_db)
 ):
-    """Render video with burned-in captions."""
+    """
+    Queue a render of the video with burned-in captions.
+    
+    Progress is reported over the project's WebSocket.
+    """
     
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     if not project.original_video_path:
         raise HTTPException(status_code=400, detail="No video uploaded")
     
-    # Mock words for now
-    words = [
-        {"text": "Hello", "start": 0.0, "end": 0.4},
-        {"text": "world", "start": 0.4, "end": 0.8},
-    ]
+    # Committed before queueing so the worker can't finish and be
+    # overwritten by this status
+    previous_status = project.status
+    project.status = ProjectStatus.RENDERING
+    project.error_message = None
+    db.commit()
     
     try:
-        # Generate ASS subtitles
-        ass_content = generate_ass(words, theme_id, width=1080, height=1920)
-        
-        # Render video
-        output_path = project.original_video_path.replace('.mp4', '_captioned.mp4')
-        render_video_with_captions(
-            project.original_video_path,
-            ass_content,
-            output_path
-        )
-        
-        project.rendered_video_path = output_path
-        project.rendered_video_url = f"/uploads/{os.path.basename(output_path)}"
-        project.status = "completed"
-        db.commit()
-        
-        return {
-            "status": "completed",
-            "video_url": project.rendered_video_url
-        }
+        task = render_video_task.delay(project_id, theme_id)
     except Exception as e:
-        project.status = "error"
-        project.error_message = str(e)
+        # Broker unreachable: no task will ever move the project on
+        project.status = previous_status
         db.commit()
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=503, detail=f"Could not queue render: {e}")
+    
+    return {
+        "status": ProjectStatus.RENDERING.value,
+        "task_id": task.id,
+    }
 
 @router.get("/{project_id}/download")
 def download_video(project_id: str, db: Session = Depends(get_db)):
     """Download rendered video."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.execute(
+        select(Project.rendered_video_path, Project.title).where(Project.id == project_id)
+    ).one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
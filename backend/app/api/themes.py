@@ -2,24 +2,80 @@
 Themes API endpoints.
 """
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import hashlib
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
-from app.database import get_db
+from caption_engine import DEFAULT_THEMES
 
 router = APIRouter()
 
+# Default themes are static, so serialize them once at import time
+THEMES = [
+    {
+        "id": theme_id,
+        **theme.to_dict(),
+        "is_default": theme.is_default,
+        "is_custom": theme.is_custom,
+    }
+    for theme_id, theme in DEFAULT_THEMES.items()
+]
+THEMES_BY_ID = {theme["id"]: theme for theme in THEMES}
+
+CACHE_CONTROL = "public, max-age=3600"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (RFC 9110, 13.1.2).
+    
+    The header may list several tags or be "*". The comparison is weak,
+    so a W/ prefix added by a proxy or CDN still matches.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+class CachedJSON:
+    """JSON body rendered once, with an ETag for conditional requests."""
+    
+    def __init__(self, data):
+        self.body = orjson.dumps(data)
+        self.etag = f'"{hashlib.md5(self.body).hexdigest()}"'
+    
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+THEMES_JSON = CachedJSON(THEMES)
+THEME_JSON_BY_ID = {theme_id: CachedJSON(theme) for theme_id, theme in THEMES_BY_ID.items()}
+
 
 @router.get("/")
-def list_themes(db: Session = Depends(get_db)):
-    return []
+def list_themes(request: Request):
+    return THEMES_JSON.response(request)
 
 
 @router.get("/{theme_id}")
-def get_theme(theme_id: str, db: Session = Depends(get_db)):
-    return {"id": theme_id, "name": "Hormozi", "animation_style": "karaoke"}
+def get_theme(theme_id: str, request: Request):
+    theme = THEME_JSON_BY_ID.get(theme_id.lower())
+    if not theme:
+        raise HTTPException(status_code=404, detail="Theme not found")
+    return theme.response(request)
 
 
 @router.post("/")
-def create_theme(db: Session = Depends(get_db)):
+def create_theme():
     return {"id": "123", "name": "Custom Theme"}
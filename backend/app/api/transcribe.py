@@ -3,9 +3,11 @@ Transcription API endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.project import Project
+from app.models.transcript import Transcript
 from app.services.transcription import transcribe_video
 
 router = APIRouter()
@@ -14,7 +16,7 @@ router = APIRouter()
 def start_transcription(project_id: str, language: str = None, db: Session = Depends(get_db)):
     """Transcribe video using Whisper."""
     
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -28,18 +30,31 @@ def start_transcription(project_id: str, language: str = None, db: Session = Dep
     try:
         # Run transcription
         result = transcribe_video(project.original_video_path, language)
+        words = result.to_words()
         
-        # Update project
+        # Replace any previous transcript and update the project in a
+        # single transaction; the words go in as one JSON value through
+        # a Core insert, skipping the ORM unit of work for the new row
+        db.execute(delete(Transcript).where(Transcript.project_id == project_id))
+        db.execute(insert(Transcript).values(
+            project_id=project_id,
+            language=result.language,
+            words_json=words,
+        ))
+        project.duration = result.duration
         project.status = "transcribed"
         db.commit()
         
         return {
             "status": "completed",
-            "words": result["words"],
-            "full_text": result["full_text"],
-            "language": result["language"]
+            "words": words,
+            "full_text": result.full_text,
+            "language": result.language
         }
     except Exception as e:
+        # A failed flush/commit leaves the transaction unusable until
+        # rolled back, which would hide the error and skip the status
+        db.rollback()
         project.status = "error"
         project.error_message = str(e)
         db.commit()
@@ -48,8 +63,18 @@ def start_transcription(project_id: str, language: str = None, db: Session = Dep
 @router.get("/{project_id}/transcript")
 def get_transcript(project_id: str, db: Session = Depends(get_db)):
     """Get transcript for a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    return {"words": [], "full_text": "", "language": "en"}
+    transcript = db.scalars(
+        select(Transcript).where(Transcript.project_id == project_id)
+    ).first()
+    if not transcript:
+        return {"words": [], "full_text": "", "language": project.language}
+    
+    return {
+        "words": transcript.words_json,
+        "full_text": transcript.full_text,
+        "language": transcript.language,
+    }
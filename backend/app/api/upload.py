@@ -2,12 +2,13 @@
 File upload API endpoints.
 """
 
-import os
 import uuid
+from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_db
+from app.database import get_db, save
 from app.models.project import Project, ProjectStatus
 from app.services.storage import storage_service
 from app.config import settings
@@ -23,11 +24,25 @@ ALLOWED_VIDEO_TYPES = {
 }
 
 
+def check_upload_size(file: UploadFile):
+    """
+    Reject uploads over the size limit.
+    
+    The multipart parser has already spooled the upload, so its size is
+    known before anything is copied into storage.
+    """
+    if file.size is not None and file.size > settings.max_upload_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Maximum: {settings.max_upload_size_mb}MB"
+        )
+
+
 @router.post("/video")
 async def upload_video(
     file: UploadFile = File(...),
     title: str = None,
-    db: AsyncSession = Depends(get_db)
+    db: Session = Depends(get_db)
 ):
     """
     Upload a video file and create a new project.
@@ -41,32 +56,15 @@ async def upload_video(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_VIDEO_TYPES)}"
         )
     
-    # Check file size (read in chunks)
-    max_size = settings.max_upload_size_mb * 1024 * 1024
-    file_size = 0
-    chunks = []
-    
-    while True:
-        chunk = await file.read(1024 * 1024)  # 1MB chunks
-        if not chunk:
-            break
-        file_size += len(chunk)
-        chunks.append(chunk)
-        
-        if file_size > max_size:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large. Maximum: {settings.max_upload_size_mb}MB"
-            )
+    check_upload_size(file)
     
     # Generate unique filename
-    file_ext = os.path.splitext(file.filename)[1] or ".mp4"
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
+    file_ext = Path(file.filename).suffix or ".mp4"
+    unique_filename = f"{uuid.uuid4().hex}{file_ext}"
     
     # Save file
-    file_content = b"".join(chunks)
-    file_path = await storage_service.save_file(
-        file_content,
+    file_path = await storage_service.save_fileobj(
+        file.file,
         unique_filename,
         folder="uploads"
     )
@@ -80,18 +78,16 @@ async def upload_video(
         original_video_url=file_url,
     )
     
-    db.add(project)
-    await db.commit()
-    await db.refresh(project)
+    await run_in_threadpool(save, db, project)
     
     # Update status to ready for transcription
     project.status = ProjectStatus.READY
-    await db.commit()
+    await run_in_threadpool(save, db, project)
     
     return {
         "project_id": str(project.id),
         "title": project.title,
-        "status": project.status.value,
+        "status": project.status,
         "video_url": file_url,
         "message": "Upload complete. Ready for transcription."
     }
@@ -112,9 +108,7 @@ async def upload_video_chunk(
     # This is a simplified implementation
     # In production, you'd want to track chunks in Redis and assemble them
     
-    chunk_path = f"chunks/{upload_id}/{chunk_number}"
-    content = await chunk.read()
-    await storage_service.save_file(content, chunk_path)
+    await storage_service.save_fileobj(chunk.file, str(chunk_number), f"chunks/{upload_id}")
     
     return {
         "upload_id": upload_id,
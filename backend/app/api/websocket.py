@@ -4,53 +4,85 @@ WebSocket API for real-time updates.
 
 import asyncio
 import json
+import logging
+import struct
+from collections import defaultdict
+from contextlib import suppress
 from typing import Dict, Set
 from uuid import UUID
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.services.events import CHANNEL_PREFIX
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# Backoff between attempts to (re)subscribe to worker events, in seconds
+RELAY_RETRY_MIN_DELAY = 1
+RELAY_RETRY_MAX_DELAY = 30
+
+# Bare progress updates are sent as 5-byte binary frames: a uint8 type
+# tag followed by the progress as a little-endian float32. Updates that
+# carry a message, and all other events, are sent as JSON text.
+PROGRESS_FRAME = struct.Struct("<Bf")
+PROGRESS_TAGS = {
+    "transcription_progress": 0,
+    "render_progress": 1,
+}
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
     
     def __init__(self):
         # Map project_id -> set of connected websockets
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
     
     async def connect(self, websocket: WebSocket, project_id: str):
         """Accept connection and add to project's connection set."""
         await websocket.accept()
-        
-        if project_id not in self.active_connections:
-            self.active_connections[project_id] = set()
-        
         self.active_connections[project_id].add(websocket)
     
     def disconnect(self, websocket: WebSocket, project_id: str):
         """Remove connection from project's connection set."""
-        if project_id in self.active_connections:
-            self.active_connections[project_id].discard(websocket)
-            
-            # Cleanup empty sets
-            if not self.active_connections[project_id]:
-                del self.active_connections[project_id]
+        connections = self.active_connections.get(project_id)
+        if connections is None:
+            return
+        
+        connections.discard(websocket)
+        
+        # Cleanup empty sets
+        if not connections:
+            del self.active_connections[project_id]
     
     async def send_to_project(self, project_id: str, message: dict):
         """Send message to all connections for a project."""
-        if project_id not in self.active_connections:
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        await self._send_payload(project_id, payload)
+    
+    async def _send_payload(self, project_id: str, payload):
+        """Send a text (str) or binary (bytes) frame to a project's clients."""
+        # Snapshot so connects/disconnects during the sends can't
+        # mutate the set we're iterating
+        connections = tuple(self.active_connections.get(project_id, ()))
+        if not connections:
             return
         
-        disconnected = set()
-        for websocket in self.active_connections[project_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                disconnected.add(websocket)
+        # Send to every client concurrently, so one slow client doesn't
+        # hold up the rest
+        if isinstance(payload, bytes):
+            sends = (websocket.send_bytes(payload) for websocket in connections)
+        else:
+            sends = (websocket.send_text(payload) for websocket in connections)
+        results = await asyncio.gather(*sends, return_exceptions=True)
         
         # Remove disconnected clients
-        for ws in disconnected:
-            self.active_connections[project_id].discard(ws)
+        for websocket, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(websocket, project_id)
     
     async def broadcast_progress(
         self,
@@ -60,6 +92,11 @@ class ConnectionManager:
         message: str = None
     ):
         """Broadcast progress update to all project connections."""
+        if message is None and progress_type in PROGRESS_TAGS:
+            frame = PROGRESS_FRAME.pack(PROGRESS_TAGS[progress_type], progress)
+            await self._send_payload(project_id, frame)
+            return
+        
         await self.send_to_project(project_id, {
             "type": progress_type,
             "progress": progress,
@@ -86,6 +123,7 @@ async def websocket_endpoint(websocket: WebSocket, project_id: str):
     Clients connect to receive:
     - transcription_progress: {progress: 0-100, message: str}
     - render_progress: {progress: 0-100, message: str}
+      (binary PROGRESS_FRAME when there is no message)
     - status_change: {status: str}
     - error: {message: str}
     """
@@ -98,32 +136,73 @@ async def websocket_endpoint(websocket: WebSocket, project_id: str):
             "project_id": project_id,
         })
         
-        # Keep connection alive and listen for messages
+        # Listen for client messages. Keepalive is handled by uvicorn's
+        # protocol-level pings (--ws-ping-interval/--ws-ping-timeout).
         while True:
-            try:
-                # Wait for any client messages (ping/pong, etc.)
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=30.0
-                )
-                
-                # Handle ping
-                if data == "ping":
-                    await websocket.send_text("pong")
-                    
-            except asyncio.TimeoutError:
-                # Send heartbeat
-                try:
-                    await websocket.send_json({"type": "heartbeat"})
-                except Exception:
-                    break
-                    
+            data = await websocket.receive_text()
+            
+            # Handle application-level ping
+            if data == "ping":
+                await websocket.send_text("pong")
+    
     except WebSocketDisconnect:
         pass
     finally:
         manager.disconnect(websocket, project_id)
 
 
+async def relay_events():
+    """
+    Relay events published by Celery workers to connected clients.
+    
+    Runs for the lifetime of the API process. A lost Redis connection
+    is logged and resubscribed with backoff, and a malformed event is
+    skipped, so neither stops later updates from reaching clients.
+    """
+    delay = RELAY_RETRY_MIN_DELAY
+    while True:
+        client = aioredis.Redis.from_url(settings.redis_url)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+            delay = RELAY_RETRY_MIN_DELAY
+            
+            async for event in pubsub.listen():
+                if event["type"] != "pmessage":
+                    continue
+                try:
+                    await relay_event(event)
+                except Exception:
+                    logger.exception("Skipping malformed event on %r", event.get("channel"))
+        except Exception:
+            logger.exception("Event relay lost Redis; resubscribing in %ss", delay)
+        finally:
+            # The connection may already be gone
+            with suppress(Exception):
+                await pubsub.close()
+            with suppress(Exception):
+                await client.close()
+        
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RELAY_RETRY_MAX_DELAY)
+
+
+async def relay_event(event: dict):
+    """Forward one pub/sub message to the project's clients."""
+    project_id = event["channel"].decode()[len(CHANNEL_PREFIX):]
+    message = json.loads(event["data"])
+    
+    if message["type"] in PROGRESS_TAGS:
+        await manager.broadcast_progress(
+            project_id,
+            message["type"],
+            message["progress"],
+            message.get("message"),
+        )
+    else:
+        await manager.send_to_project(project_id, message)
+
+
 # Helper functions for other modules to send updates
 async def send_transcription_progress(project_id: str, progress: float, message: str = None):
     """Send transcription progress update."""
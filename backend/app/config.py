@@ -3,7 +3,7 @@ Application Configuration
 """
 
 import os
-from typing import Optional, List
+from typing import Literal, Optional, List
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -37,10 +37,18 @@ class Settings(BaseSettings):
     ffprobe_path: str = "/usr/bin/ffprobe"
     fonts_dir: str = "./fonts"
     temp_dir: str = "/tmp"
+    hwaccel: Literal["auto", "none", "nvenc", "qsv", "vaapi"] = "auto"
+    vaapi_device: str = "/dev/dri/renderD128"
+    video_encoder: str = "libx264"  # Software encoder when no hwaccel is used
     
     # Whisper
     whisper_model: str = "base"
-    whisper_device: str = "cpu"
+    whisper_model_en: Optional[str] = "distil-small.en"  # Used when language is "en"
+    whisper_device: str = "auto"  # auto, cpu or cuda
+    whisper_compute_type: str = "auto"  # auto or a CTranslate2 type, e.g. float16
+    whisper_batch_size: int = 8  # Audio chunks per batch; 1 decodes sequentially
+    whisper_num_workers: int = 2  # Concurrent transcriptions per device
+    whisper_cpu_threads: int = 0  # Per worker; 0 splits all cores between workers
     
     # Upload limits
     max_upload_size_mb: int = 500
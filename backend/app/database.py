@@ -2,15 +2,45 @@
 Database configuration - simplified for SQLite.
 """
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.config import settings
 
+is_sqlite = settings.database_url.startswith("sqlite")
+
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False} if is_sqlite else {},
+    # Room for every compiled statement the app issues
+    query_cache_size=1200,
+    # JSON columns (transcript words) can hold thousands of entries
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+
+# PRAGMAs applied to every new SQLite connection. WAL lets readers run
+# while a write (e.g. a worker saving a render) is in progress, and the
+# busy timeout makes a second writer wait instead of failing at once.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=2000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
 )
 
+if is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -26,6 +56,19 @@ def close_db():
     engine.dispose()
 
 
+def save(db, instance):
+    """
+    Add an instance, commit and refresh it.
+    
+    This blocks on the database; call it through run_in_threadpool
+    from async routes.
+    """
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+    return instance
+
+
 def get_db():
     db = SessionLocal()
     try:
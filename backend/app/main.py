@@ -2,18 +2,24 @@
 CaptionMagic - Main FastAPI Application
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import init_db
 from app.api import api_router
+from app.api.websocket import relay_events
+from app.services.storage import storage_service
 
 app = FastAPI(
     title=settings.app_name,
     description="Open-source video captioning with animated subtitles",
     version="0.1.0",
     redirect_slashes=False,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -32,6 +38,17 @@ def startup():
     init_db()
 
 
+@app.on_event("startup")
+async def start_event_relay():
+    # Forward worker progress events to WebSocket clients
+    app.state.event_relay = asyncio.create_task(relay_events())
+
+
+@app.on_event("shutdown")
+async def close_storage():
+    await storage_service.close()
+
+
 @app.get("/")
 def root():
     return {"name": settings.app_name, "status": "running", "docs": "/docs"}
@@ -25,7 +25,7 @@ class Project(Base):
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
-    status = Column(String(20), default="uploading")
+    status = Column(String(20), default="uploading", index=True)
     
     original_video_path = Column(String(500))
     original_video_url = Column(String(1000))
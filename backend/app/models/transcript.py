@@ -4,9 +4,10 @@ Transcript database model - SQLite compatible.
 
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey
 
 from app.database import Base
+from app.models.types import JSONBlob
 
 
 class Transcript(Base):
@@ -16,14 +17,20 @@ class Transcript(Base):
     project_id = Column(String(36), ForeignKey("projects.id"), nullable=False)
     
     language = Column(String(10), default="en")
-    full_text = Column(Text)
-    words_json = Column(JSON, default=list)
+    words_json = Column(JSONBlob, default=list)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @property
+    def full_text(self) -> str:
+        """Transcript text, derived from the words so it can't drift."""
+        return " ".join(word["text"] for word in self.words_json or [])
 
 
 class Word:
+    __slots__ = ("text", "start", "end", "confidence")
+    
     def __init__(self, text: str, start: float, end: float, confidence: float = 1.0):
         self.text = text
         self.start = start
@@ -0,0 +1,35 @@
+"""
+Custom column types.
+"""
+
+import orjson
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONBlob(TypeDecorator):
+    """
+    JSON column stored in binary form.
+    
+    PostgreSQL uses native JSONB. Other databases (SQLite) store the
+    orjson-encoded bytes as a BLOB, which is parsed straight from bytes
+    on read with no text column decode in between.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(LargeBinary())
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return orjson.dumps(value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return orjson.loads(value)
@@ -0,0 +1,21 @@
+"""
+Shared Pydantic schema bases.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMResponse(BaseModel):
+    """Base for response schemas built from our own database rows."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """
+        Build from a trusted ORM object or Row without validation.
+        
+        Rows come from our own database, so model_validate would only
+        re-check data we wrote. Use model_validate for API input.
+        """
+        data = {field: getattr(obj, field) for field in cls.model_fields}
+        return cls.model_construct(_fields_set=set(data), **data)
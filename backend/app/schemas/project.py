@@ -4,7 +4,9 @@ Project Pydantic schemas.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
+
+from app.schemas.base import ORMResponse
 
 
 class ProjectCreate(BaseModel):
@@ -18,8 +20,7 @@ class ProjectUpdate(BaseModel):
     theme_id: Optional[str] = None
 
 
-class ProjectResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class ProjectResponse(ORMResponse):
     id: str
     title: str
     status: str
@@ -4,7 +4,9 @@ Theme Pydantic schemas.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from app.schemas.base import ORMResponse
 
 
 class ThemeBase(BaseModel):
@@ -43,8 +45,7 @@ class ThemeUpdate(BaseModel):
     animation_style: Optional[str] = None
 
 
-class ThemeResponse(ThemeBase):
-    model_config = ConfigDict(from_attributes=True)
+class ThemeResponse(ThemeBase, ORMResponse):
     id: str
     is_default: bool
     is_custom: bool
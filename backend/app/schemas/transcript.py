@@ -5,7 +5,9 @@ Transcript Pydantic schemas.
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
+
+from app.schemas.base import ORMResponse
 
 
 class WordResponse(BaseModel):
@@ -16,9 +18,8 @@ class WordResponse(BaseModel):
     confidence: float = 1.0
 
 
-class TranscriptResponse(BaseModel):
+class TranscriptResponse(ORMResponse):
     """Schema for transcript responses."""
-    model_config = ConfigDict(from_attributes=True)
     
     id: UUID
     project_id: UUID
@@ -32,5 +33,4 @@ class TranscriptResponse(BaseModel):
 class TranscriptCreate(BaseModel):
     """Schema for creating a transcript."""
     language: str = "en"
-    full_text: str
     words_json: List[dict] = []
@@ -0,0 +1,53 @@
+"""
+Project event publishing over Redis pub/sub.
+
+Celery tasks run in separate worker processes, so they publish project
+updates here and the API process relays them to WebSocket clients.
+"""
+
+import json
+import redis
+
+from app.config import settings
+
+# Events for a project are published on "project:<project_id>"
+CHANNEL_PREFIX = "project:"
+
+_client = None
+
+
+def get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.redis_url)
+    return _client
+
+
+def publish(project_id: str, message: dict):
+    """Publish an event for a project."""
+    get_redis().publish(f"{CHANNEL_PREFIX}{project_id}", json.dumps(message))
+
+
+def publish_progress(project_id: str, progress_type: str, progress: float, message: str = None):
+    """Publish a progress update."""
+    publish(project_id, {
+        "type": progress_type,
+        "progress": progress,
+        "message": message,
+    })
+
+
+def publish_status_change(project_id: str, status: str):
+    """Publish a status change."""
+    publish(project_id, {
+        "type": "status_change",
+        "status": status,
+    })
+
+
+def publish_error(project_id: str, error_message: str):
+    """Publish an error."""
+    publish(project_id, {
+        "type": "error",
+        "message": error_message,
+    })
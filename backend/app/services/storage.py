@@ -4,24 +4,47 @@ Storage service for file management.
 Supports local filesystem and S3-compatible storage.
 """
 
+import asyncio
 import os
+import shutil
 import aiofiles
+import aioboto3
 from abc import ABC, abstractmethod
-from typing import Optional
-import boto3
+from contextlib import AsyncExitStack
+from io import BytesIO
+from typing import AsyncIterator, BinaryIO, Optional, Union
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 
+# Buffer size for copying uploads into storage
+CHUNK_SIZE = 1024 * 1024
+
+# Large S3 transfers go as 8MB parts, up to 8 in flight
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+)
+
+# File content as one buffer, or streamed in chunks
+FileContent = Union[bytes, AsyncIterator[bytes]]
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
     
     @abstractmethod
-    async def save_file(self, content: bytes, filename: str, folder: str = "") -> str:
+    async def save_file(self, content: FileContent, filename: str, folder: str = "") -> str:
         """Save file and return path."""
         pass
     
+    @abstractmethod
+    async def save_fileobj(self, fileobj: BinaryIO, filename: str, folder: str = "") -> str:
+        """Copy a file object into storage and return path."""
+        pass
+    
     @abstractmethod
     async def get_file(self, path: str) -> bytes:
         """Get file content."""
@@ -41,6 +64,10 @@ class StorageBackend(ABC):
     async def exists(self, path: str) -> bool:
         """Check if file exists."""
         pass
+    
+    async def close(self):
+        """Release any open connections."""
+        pass
 
 
 class LocalStorage(StorageBackend):
@@ -53,35 +80,45 @@ class LocalStorage(StorageBackend):
     def _get_full_path(self, path: str) -> str:
         return os.path.join(self.base_path, path)
     
-    async def save_file(self, content: bytes, filename: str, folder: str = "") -> str:
+    def _prepare_path(self, filename: str, folder: str = "") -> str:
+        """Build the relative path for a file, creating its folder."""
+        path = os.path.join(folder, filename) if folder else filename
+        os.makedirs(os.path.dirname(self._get_full_path(path)), exist_ok=True)
+        return path
+    
+    async def save_file(self, content: FileContent, filename: str, folder: str = "") -> str:
         """Save file to local filesystem."""
-        if folder:
-            dir_path = os.path.join(self.base_path, folder)
-            os.makedirs(dir_path, exist_ok=True)
-            path = os.path.join(folder, filename)
-        else:
-            path = filename
-        
+        path = self._prepare_path(filename, folder)
         full_path = self._get_full_path(path)
         
-        async with aiofiles.open(full_path, 'wb') as f:
-            await f.write(content)
+        if isinstance(content, bytes):
+            # One thread hop for open+write+close instead of one per call
+            await run_in_threadpool(write_path, full_path, content)
+        else:
+            async with aiofiles.open(full_path, 'wb') as f:
+                async for chunk in content:
+                    await f.write(chunk)
         
         return path
     
+    async def save_fileobj(self, fileobj: BinaryIO, filename: str, folder: str = "") -> str:
+        """Copy a file object to the local filesystem."""
+        path = self._prepare_path(filename, folder)
+        await run_in_threadpool(copy_to_path, fileobj, self._get_full_path(path))
+        return path
+    
     async def get_file(self, path: str) -> bytes:
         """Read file from local filesystem."""
         full_path = self._get_full_path(path)
         
-        async with aiofiles.open(full_path, 'rb') as f:
-            return await f.read()
+        return await run_in_threadpool(read_path, full_path)
     
     async def delete_file(self, path: str) -> bool:
         """Delete file from local filesystem."""
         full_path = self._get_full_path(path)
         
         try:
-            os.remove(full_path)
+            await run_in_threadpool(os.remove, full_path)
             return True
         except OSError:
             return False
@@ -107,48 +144,87 @@ class S3Storage(StorageBackend):
         region: str = "us-east-1"
     ):
         self.bucket = bucket
-        self.client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
+        self.session = aioboto3.Session(
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
             region_name=region,
         )
-        
-        # Ensure bucket exists
-        try:
-            self.client.head_bucket(Bucket=bucket)
-        except ClientError:
-            self.client.create_bucket(Bucket=bucket)
+        self.endpoint_url = endpoint_url
+        self._client = None
+        self._client_stack = None
+        self._client_lock = asyncio.Lock()
+    
+    async def _get_client(self):
+        """Open the shared client on first use and ensure the bucket exists."""
+        if self._client is None:
+            # Concurrent first calls would each open a client otherwise
+            async with self._client_lock:
+                if self._client is None:
+                    stack = AsyncExitStack()
+                    try:
+                        client = await stack.enter_async_context(
+                            self.session.client('s3', endpoint_url=self.endpoint_url)
+                        )
+                        
+                        # Ensure bucket exists
+                        try:
+                            await client.head_bucket(Bucket=self.bucket)
+                        except ClientError:
+                            await client.create_bucket(Bucket=self.bucket)
+                    except BaseException:
+                        await stack.aclose()
+                        raise
+                    
+                    self._client_stack = stack
+                    self._client = client
+        return self._client
     
-    async def save_file(self, content: bytes, filename: str, folder: str = "") -> str:
+    async def close(self):
+        """Close the shared client; the next call opens a new one."""
+        async with self._client_lock:
+            if self._client_stack is not None:
+                stack = self._client_stack
+                self._client = None
+                self._client_stack = None
+                await stack.aclose()
+    
+    async def save_file(self, content: FileContent, filename: str, folder: str = "") -> str:
         """Save file to S3."""
+        if isinstance(content, bytes):
+            fileobj = BytesIO(content)
+        else:
+            fileobj = AsyncChunkReader(content)
+        return await self.save_fileobj(fileobj, filename, folder)
+    
+    async def save_fileobj(self, fileobj: BinaryIO, filename: str, folder: str = "") -> str:
+        """Upload a file object to S3 (concurrent multipart for large files)."""
         key = f"{folder}/{filename}" if folder else filename
         
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=content,
-        )
+        client = await self._get_client()
+        await client.upload_fileobj(fileobj, self.bucket, key, Config=S3_TRANSFER_CONFIG)
         
         return key
     
     async def get_file(self, path: str) -> bytes:
         """Get file from S3."""
-        response = self.client.get_object(Bucket=self.bucket, Key=path)
-        return response['Body'].read()
+        client = await self._get_client()
+        buffer = BytesIO()
+        await client.download_fileobj(self.bucket, path, buffer, Config=S3_TRANSFER_CONFIG)
+        return buffer.getvalue()
     
     async def delete_file(self, path: str) -> bool:
         """Delete file from S3."""
+        client = await self._get_client()
         try:
-            self.client.delete_object(Bucket=self.bucket, Key=path)
+            await client.delete_object(Bucket=self.bucket, Key=path)
             return True
         except ClientError:
             return False
     
     async def get_url(self, path: str, expires_in: int = 3600) -> str:
         """Get presigned URL for S3 object."""
-        url = self.client.generate_presigned_url(
+        client = await self._get_client()
+        url = await client.generate_presigned_url(
             'get_object',
             Params={'Bucket': self.bucket, 'Key': path},
             ExpiresIn=expires_in,
@@ -157,13 +233,61 @@ class S3Storage(StorageBackend):
     
     async def exists(self, path: str) -> bool:
         """Check if file exists in S3."""
+        client = await self._get_client()
         try:
-            self.client.head_object(Bucket=self.bucket, Key=path)
+            await client.head_object(Bucket=self.bucket, Key=path)
             return True
         except ClientError:
             return False
 
 
+class AsyncChunkReader:
+    """File-like wrapper exposing an async chunk iterator through read()."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self.chunks = chunks.__aiter__()
+        self.buffer = bytearray()
+        self.done = False
+    
+    async def read(self, size: int = -1) -> bytes:
+        while not self.done and (size < 0 or len(self.buffer) < size):
+            try:
+                self.buffer += await self.chunks.__anext__()
+            except StopAsyncIteration:
+                self.done = True
+        
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+def read_path(full_path: str) -> bytes:
+    """Read a whole file from disk."""
+    with open(full_path, 'rb') as f:
+        return f.read()
+
+
+def write_path(full_path: str, content: bytes):
+    """Write a whole file to disk."""
+    with open(full_path, 'wb') as f:
+        f.write(content)
+
+
+def copy_to_path(fileobj: BinaryIO, full_path: str):
+    """Copy a file object to disk, removing the partial file on failure."""
+    try:
+        with open(full_path, 'wb') as f:
+            shutil.copyfileobj(fileobj, f, CHUNK_SIZE)
+    except BaseException:
+        try:
+            os.remove(full_path)
+        except OSError:
+            pass
+        raise
+
+
 class StorageService:
     """
     Storage service that wraps the configured backend.
@@ -183,9 +307,12 @@ class StorageService:
         else:
             self.backend = LocalStorage(settings.storage_path)
     
-    async def save_file(self, content: bytes, filename: str, folder: str = "") -> str:
+    async def save_file(self, content: FileContent, filename: str, folder: str = "") -> str:
         return await self.backend.save_file(content, filename, folder)
     
+    async def save_fileobj(self, fileobj: BinaryIO, filename: str, folder: str = "") -> str:
+        return await self.backend.save_fileobj(fileobj, filename, folder)
+    
     async def get_file(self, path: str) -> bytes:
         return await self.backend.get_file(path)
     
@@ -197,6 +324,9 @@ class StorageService:
     
     async def exists(self, path: str) -> bool:
         return await self.backend.exists(path)
+    
+    async def close(self):
+        await self.backend.close()
 
 
 # Global storage service instance
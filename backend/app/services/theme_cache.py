@@ -0,0 +1,54 @@
+"""
+Theme resolution for rendering, with custom themes cached per version.
+"""
+
+from dataclasses import fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Union
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from caption_engine import DEFAULT_THEMES, Theme as CaptionTheme
+
+from app.database import SessionLocal
+from app.models.theme import Theme
+
+# Columns shared by the themes table and the caption engine's Theme
+THEME_COLUMNS = tuple(
+    getattr(Theme, f.name) for f in fields(CaptionTheme) if hasattr(Theme, f.name)
+)
+
+
+@lru_cache(maxsize=256)
+def get_theme_cached(theme_id: str, version: Union[datetime, int]) -> CaptionTheme:
+    """
+    Load a custom theme from the database.
+    
+    `version` is the row's updated_at, so an edited theme misses the
+    cache instead of serving stale styling.
+    """
+    db = SessionLocal()
+    try:
+        row = db.execute(select(*THEME_COLUMNS).where(Theme.id == theme_id)).one()
+    finally:
+        db.close()
+    return CaptionTheme.from_dict(dict(row._mapping))
+
+
+def resolve_theme(db: Session, theme_id: str) -> Union[str, CaptionTheme]:
+    """Resolve a theme id to something generate_ass accepts."""
+    if theme_id.lower() in DEFAULT_THEMES:
+        return theme_id
+    
+    row = db.execute(
+        select(Theme.updated_at, Theme.created_at).where(Theme.id == theme_id)
+    ).one_or_none()
+    if row is None:
+        raise ValueError(f"Unknown theme: {theme_id}")
+    
+    # Older rows can have no timestamps; any edit sets updated_at, which
+    # changes the key
+    version = row.updated_at or row.created_at or 0
+    return get_theme_cached(theme_id, version)
@@ -1,48 +1,262 @@
 """
-Whisper transcription service.
+Whisper transcription service (faster-whisper / CTranslate2).
 """
 
-import whisper
-import tempfile
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import ctranslate2
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+import numpy as np
 import os
+import subprocess
+import tempfile
+import threading
+
+from app.config import settings
+from app.services.video import ffmpeg_command
+
+# Whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Starting size of the decoded audio buffer; longer files double it
+INITIAL_AUDIO_SECONDS = 60
+
+# Silero VAD settings for the sequential model: cut at half-second
+# pauses (WhisperModel's default waits 2s) so more silence is dropped
+# before the encoder. The batched pipeline already splits at 160ms and
+# keeps its own defaults.
+VAD_PARAMETERS = {"min_silence_duration_ms": 500, "speech_pad_ms": 200}
+
+# Whisper's looping failure mode: the same phrase over and over. A run
+# of 3-8 words repeated back to back more than twice is cut to two.
+LOOP_NGRAM_SIZES = range(3, 9)
+LOOP_MAX_REPEATS = 2
+
+# Models load once per name, shared by every thread in the process
+models = {}
+model_lock = threading.Lock()
+
+def get_cpu_threads() -> int:
+    """
+    Threads per CTranslate2 worker.
+    
+    Defaults to splitting all cores between the workers; CTranslate2's
+    own default is only 4, which leaves the int8 GEMMs short of cores.
+    """
+    if settings.whisper_cpu_threads:
+        return settings.whisper_cpu_threads
+    return max(1, (os.cpu_count() or 1) // settings.whisper_num_workers)
+
+def get_device() -> str:
+    """Resolve the whisper_device setting; "auto" uses CUDA when present."""
+    if settings.whisper_device != "auto":
+        return settings.whisper_device
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+def get_device_indexes(device: str) -> List[int]:
+    """All visible GPUs for CUDA; CPU has a single device."""
+    if device == "cuda":
+        return list(range(ctranslate2.get_cuda_device_count())) or [0]
+    return [0]
+
+def get_compute_type(device: str) -> str:
+    """
+    Resolve the whisper_compute_type setting.
+    
+    "auto" quantizes to int8 on CPU and int8 weights with fp16 compute
+    on GPU. CTranslate2 quantizes the converted weights as they load,
+    so no separate int8 model needs to be built.
+    """
+    if settings.whisper_compute_type != "auto":
+        return settings.whisper_compute_type
+    return "int8_float16" if device == "cuda" else "int8"
 
-# Load model once
-model = None
+def get_model_name(language: str = None) -> str:
+    """English jobs can use a faster English-only model (e.g. distil-whisper)."""
+    if language == "en" and settings.whisper_model_en:
+        return settings.whisper_model_en
+    return settings.whisper_model
 
-def get_model():
-    global model
-    if model is None:
-        print("Loading Whisper model...")
-        model = whisper.load_model("base")
+def get_model(name: str = None):
+    name = name or settings.whisper_model
+    model = models.get(name)
+    if model is not None:
+        return model
+    with model_lock:
+        if name in models:
+            return models[name]
+        print(f"Loading Whisper model {name}...")
+        device = get_device()
+        compute_type = get_compute_type(device)
+        model = WhisperModel(
+            name,
+            device=device,
+            # Every GPU; CTranslate2 spreads concurrent calls across them
+            device_index=get_device_indexes(device),
+            compute_type=compute_type,
+            cpu_threads=get_cpu_threads(),
+            # Lets requests on separate threads run in parallel on one model
+            num_workers=settings.whisper_num_workers
+        )
+        if settings.whisper_batch_size > 1:
+            # Decode VAD chunks of a clip in batches instead of one
+            # 30s window at a time
+            model = BatchedInferencePipeline(model)
+        # Publish only the finished model to threads that skip the lock
+        models[name] = model
         print("Whisper model loaded!")
     return model
 
-def transcribe_video(video_path: str, language: str = None) -> dict:
+def load_audio(video_path: str) -> np.ndarray:
+    """
+    Decode a file's audio track to 16 kHz mono float32 samples.
+    
+    FFmpeg writes raw PCM to a pipe, so nothing touches the disk. The
+    pipe is read straight into an int16 array, doubled whenever it
+    fills, instead of collecting bytes chunks and joining them.
+    """
+    cmd = ffmpeg_command([
+        '-i', video_path,
+        '-vn', '-ac', '1', '-ar', str(SAMPLE_RATE),
+        '-f', 's16le', '-'
+    ])
+    samples = np.empty(INITIAL_AUDIO_SECONDS * SAMPLE_RATE, np.int16)
+    filled = 0  # bytes
+    
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, close_fds=False
+        )
+        with process.stdout:
+            while True:
+                if filled == samples.nbytes:
+                    # Full; grow geometrically so copies stay amortized
+                    grown = np.empty(len(samples) * 2, np.int16)
+                    grown[:len(samples)] = samples
+                    samples = grown
+                read = process.stdout.readinto(memoryview(samples).cast('B')[filled:])
+                if not read:
+                    break
+                filled += read
+        
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise Exception(f"FFmpeg error: {stderr.read().decode(errors='replace')}")
+    
+    # Scale in place so only one float32 buffer is allocated
+    audio = samples[:filled // 2].astype(np.float32)
+    audio *= 1 / 32768.0
+    return audio
+
+@dataclass(slots=True)
+class TranscriptionResult:
+    """
+    Word timings kept as parallel columns.
+    
+    Word dicts are only built by to_words(), when they're stored or
+    returned from the API.
+    """
+    texts: List[str]
+    starts: np.ndarray
+    ends: np.ndarray
+    confidences: np.ndarray
+    full_text: str
+    language: str
+    duration: float
+    
+    def to_words(self) -> List[dict]:
+        return [
+            {"text": text, "start": start, "end": end, "confidence": confidence}
+            for text, start, end, confidence in zip(
+                self.texts,
+                np.round(self.starts, 3).tolist(),
+                np.round(self.ends, 3).tolist(),
+                np.round(self.confidences, 3).tolist(),
+            )
+        ]
+
+
+def transcribe_video(
+    video_path: str,
+    language: str = None,
+    on_progress: Optional[Callable[[float], None]] = None
+) -> TranscriptionResult:
     """
     Transcribe video using Whisper.
     Returns word-level timestamps.
+    
+    Segments are decoded lazily, one window at a time, as the loop below
+    consumes them; on_progress, if given, receives the fraction of the
+    audio transcribed after each one.
     """
-    m = get_model()
+    m = get_model(get_model_name(language))
+    audio = load_audio(video_path)
     
-    result = m.transcribe(
-        video_path,
+    options = {}
+    if isinstance(m, BatchedInferencePipeline):
+        options["batch_size"] = settings.whisper_batch_size
+    else:
+        # Don't prompt each window with the last one's text: fewer decoder
+        # tokens, and one window's errors don't carry into the next
+        # (the batched pipeline never conditions)
+        options["condition_on_previous_text"] = False
+        options["vad_parameters"] = VAD_PARAMETERS
+    
+    segments, info = m.transcribe(
+        audio,
         language=language,
         word_timestamps=True,
-        verbose=False
+        vad_filter=True,
+        beam_size=5,
+        **options
     )
     
-    words = []
-    for segment in result.get("segments", []):
-        for word_info in segment.get("words", []):
-            words.append({
-                "text": word_info["word"].strip(),
-                "start": round(word_info["start"], 3),
-                "end": round(word_info["end"], 3),
-                "confidence": round(word_info.get("probability", 1.0), 3)
-            })
-    
-    return {
-        "words": words,
-        "full_text": result.get("text", "").strip(),
-        "language": result.get("language", "en")
-    }
+    word_texts = []
+    starts = []
+    ends = []
+    probabilities = []
+    for segment in segments:
+        for word_info in segment.words:
+            word_texts.append(word_info.word.strip())
+            starts.append(word_info.start)
+            ends.append(word_info.end)
+            probabilities.append(word_info.probability)
+        if on_progress and info.duration:
+            on_progress(min(segment.end / info.duration, 1.0))
+    
+    keep = _drop_repeated_ngrams(word_texts)
+    texts = [word_texts[i] for i in keep]
+    
+    return TranscriptionResult(
+        texts=texts,
+        starts=np.array(starts, dtype=np.float64)[keep],
+        ends=np.array(ends, dtype=np.float64)[keep],
+        confidences=np.array(probabilities, dtype=np.float64)[keep],
+        # Same derivation as Transcript.full_text
+        full_text=" ".join(texts),
+        language=info.language,
+        # Free from the decoded samples; no ffprobe needed
+        duration=len(audio) / SAMPLE_RATE
+    )
+
+
+def _drop_repeated_ngrams(texts: List[str]) -> List[int]:
+    """Indices of the words to keep once Whisper's loops are cut down."""
+    words = [text.lower().strip(".,!?") for text in texts]
+    keep = []
+    i = 0
+    while i < len(words):
+        for n in LOOP_NGRAM_SIZES:
+            ngram = words[i:i + n]
+            end = i + n
+            while words[end:end + n] == ngram:
+                end += n
+            if len(ngram) == n and end - i > n * LOOP_MAX_REPEATS:
+                keep.extend(range(i, i + n * LOOP_MAX_REPEATS))
+                i = end
+                break
+        else:
+            keep.append(i)
+            i += 1
+    return keep
@@ -4,15 +4,171 @@ Video rendering service using FFmpeg.
 
 import subprocess
 import os
+import re
+import shutil
 import tempfile
+from functools import lru_cache
+from typing import Callable, Optional
+
+from app.config import settings
+
+# Binaries come from settings, resolved once to an absolute path, which
+# lets subprocess use posix_spawn instead of fork+exec
+FFMPEG = shutil.which(settings.ffmpeg_path) or settings.ffmpeg_path
+FFPROBE = shutil.which(settings.ffprobe_path) or settings.ffprobe_path
+
+# Hardware encoder profiles, in the order "auto" tries them.
+# Subtitles are burned in on the CPU by the ass filter, so frames are
+# converted/uploaded to the device only after it. Where the same device
+# can decode, decode_args move decoding there too; without an
+# -hwaccel_output_format the frames come back to system memory for the
+# ass filter, and ffmpeg falls back to software decoding on its own.
+HWACCEL_PROFILES = {
+    "nvenc": {
+        "encoder": "h264_nvenc",
+        "input_args": [],
+        "decode_args": ["-hwaccel", "cuda"],
+        "filters": "",
+        "output_args": ["-preset", "p4", "-tune", "hq"],
+    },
+    "qsv": {
+        "encoder": "h264_qsv",
+        "input_args": [],
+        "decode_args": [],
+        "filters": ",format=nv12",
+        "output_args": [],
+    },
+    "vaapi": {
+        "encoder": "h264_vaapi",
+        "input_args": ["-vaapi_device", settings.vaapi_device],
+        "decode_args": ["-hwaccel", "vaapi", "-hwaccel_device", settings.vaapi_device],
+        "filters": ",format=nv12,hwupload",
+        "output_args": [],
+    },
+}
+
+
+# Encoded position in ffmpeg's -progress output
+OUT_TIME_US = re.compile(rb"^out_time_us=(\d+)$", re.MULTILINE)
+
+# FFmpeg unescapes a filter option twice: once as an option value, where
+# backslash, ' and : are special, then again when the filtergraph is
+# parsed, where backslash, ' [ ] , and ; are. Escape in that order.
+_FILTER_OPTION_ESCAPE = str.maketrans({c: '\\' + c for c in "\\':"})
+_FILTERGRAPH_ESCAPE = str.maketrans({c: '\\' + c for c in "\\'[],;"})
+
+
+def _escape_filter_path(path: str) -> str:
+    """Escape a file path for use as a filter option, e.g. ass=<path>."""
+    return path.translate(_FILTER_OPTION_ESCAPE).translate(_FILTERGRAPH_ESCAPE)
+
+
+def ffmpeg_command(args: list) -> list:
+    """
+    Build an ffmpeg command line that logs only errors to stderr.
+    
+    Progress stats would otherwise fill the captured stderr for the
+    whole encode.
+    """
+    return [FFMPEG, '-nostdin', '-hide_banner', '-v', 'error', *args]
+
+
+def run_ffmpeg(args: list, **kwargs) -> subprocess.CompletedProcess:
+    """Run ffmpeg to completion; see ffmpeg_command."""
+    return subprocess.run(ffmpeg_command(args), close_fds=False, **kwargs)
+
+
+def run_ffmpeg_with_progress(
+    args: list,
+    duration: float,
+    on_progress: Callable[[float], None]
+) -> subprocess.CompletedProcess:
+    """
+    Run ffmpeg, reporting the fraction of `duration` encoded so far.
+    
+    Progress comes from -progress on stdout, read in raw chunks and
+    scanned with one compiled regex per chunk; only the latest
+    out_time_us is converted, and on_progress fires once per whole
+    percent. stderr goes to a temp file, so a single blocking read loop
+    can't deadlock on a full pipe.
+    """
+    cmd = ffmpeg_command(['-progress', 'pipe:1', '-nostats', *args])
+    duration_us = duration * 1_000_000
+    reported = -1
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, close_fds=False
+        )
+        with process.stdout:
+            fd = process.stdout.fileno()
+            pending = b""
+            while chunk := os.read(fd, 4096):
+                buffer = pending + chunk
+                cut = buffer.rfind(b"\n") + 1
+                pending = buffer[cut:]
+                times = OUT_TIME_US.findall(buffer, 0, cut)
+                if times:
+                    percent = min(int(int(times[-1]) * 100 / duration_us), 100)
+                    if percent > reported:
+                        reported = percent
+                        on_progress(percent / 100)
+        returncode = process.wait()
+        
+        stderr.seek(0)
+        return subprocess.CompletedProcess(
+            cmd, returncode, None, stderr.read().decode(errors='replace')
+        )
+
+
+def _encoder_works(profile: dict) -> bool:
+    """Check that an encoder can actually encode on this machine."""
+    args = [
+        *profile["input_args"],
+        '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+        '-vf', f"null{profile['filters']}",
+        '-c:v', profile["encoder"],
+        '-f', 'null', '-'
+    ]
+    try:
+        result = run_ffmpeg(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache()
+def get_hwaccel_profile() -> Optional[dict]:
+    """
+    Resolve the hardware encoder profile from settings.
+    
+    Returns None for software encoding. Probing runs once per process.
+    """
+    if settings.hwaccel == "none":
+        return None
+    if settings.hwaccel != "auto":
+        return HWACCEL_PROFILES[settings.hwaccel]
+    
+    for profile in HWACCEL_PROFILES.values():
+        if _encoder_works(profile):
+            return profile
+    return None
+
 
 def render_video_with_captions(
     input_video: str,
     ass_content: str,
-    output_path: str = None
+    output_path: str = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+    duration: Optional[float] = None
 ) -> str:
     """
     Burn ASS subtitles into video using FFmpeg.
+    
+    Uses a hardware encoder when one is configured or detected.
+    on_progress, if given, receives the fraction rendered (0-1). Pass
+    the known duration to skip probing the input for it.
     """
     if output_path is None:
         output_path = input_video.replace('.mp4', '_captioned.mp4')
@@ -21,17 +177,41 @@ def render_video_with_captions(
     with tempfile.NamedTemporaryFile(mode='w', suffix='.ass', delete=False) as f:
         f.write(ass_content)
         ass_path = f.name
+    ass_filter = f"ass={_escape_filter_path(ass_path)}"
     
     try:
-        cmd = [
-            'ffmpeg', '-y',
-            '-i', input_video,
-            '-vf', f"ass={ass_path}",
-            '-c:a', 'copy',
-            output_path
-        ]
+        profile = get_hwaccel_profile()
+        
+        if profile:
+            args = [
+                '-y',
+                *profile["input_args"],
+                *profile["decode_args"],
+                '-i', input_video,
+                '-vf', f"{ass_filter}{profile['filters']}",
+                '-c:v', profile["encoder"],
+                *profile["output_args"],
+                '-c:a', 'copy',
+                output_path
+            ]
+        else:
+            args = [
+                '-y',
+                '-i', input_video,
+                '-vf', ass_filter,
+                '-c:v', settings.video_encoder,
+                '-c:a', 'copy',
+                output_path
+            ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        if on_progress and not duration:
+            duration = get_video_duration(input_video)
+        if on_progress and duration:
+            result = run_ffmpeg_with_progress(args, duration, on_progress)
+        else:
+            result = run_ffmpeg(
+                args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
         
         if result.returncode != 0:
             raise Exception(f"FFmpeg error: {result.stderr}")
@@ -42,11 +222,18 @@ def render_video_with_captions(
 
 def get_video_duration(video_path: str) -> float:
     """Get video duration in seconds."""
+    stat = os.stat(video_path)
+    return _probe_duration(video_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(video_path: str, mtime_ns: int, size: int) -> float:
+    """Run ffprobe once per file version; mtime and size key the cache."""
     cmd = [
-        'ffprobe', '-v', 'error',
+        FFPROBE, '-v', 'error',
         '-show_entries', 'format=duration',
         '-of', 'default=noprint_wrappers=1:nokey=1',
         video_path
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, close_fds=False)
     return float(result.stdout.strip())
@@ -24,4 +24,9 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,
     worker_prefetch_multiplier=1,
+    # Route to the dedicated worker queues (see docker-compose.yml)
+    task_routes={
+        "app.tasks.transcribe.*": {"queue": "transcription"},
+        "app.tasks.render.*": {"queue": "rendering"},
+    },
 )
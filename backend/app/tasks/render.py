@@ -2,13 +2,79 @@
 Video rendering Celery tasks.
 """
 
+import os
+
+from caption_engine import generate_ass
+
+from app.database import SessionLocal
+from app.models.project import Project, ProjectStatus
+from app.services.events import publish_progress, publish_status_change, publish_error
+from app.services.theme_cache import resolve_theme
+from app.services.video import render_video_with_captions
 from app.tasks.celery_app import celery_app
 
+# Mock words for now
+MOCK_WORDS = [
+    {"text": "Hello", "start": 0.0, "end": 0.4},
+    {"text": "world", "start": 0.4, "end": 0.8},
+]
+
 
 @celery_app.task(bind=True)
-def render_video_task(self, project_id: str, video_path: str, ass_path: str):
+def render_video_task(self, project_id: str, theme_id: str = "hormozi"):
     """
     Async task to render video with captions.
+    
+    Progress and status changes are published for WebSocket clients.
     """
-    # Placeholder - will implement later
-    return {"status": "completed", "project_id": project_id}
+    db = SessionLocal()
+    try:
+        project = db.get(Project, project_id)
+        if not project:
+            return {"status": "error", "project_id": project_id, "message": "Project not found"}
+        
+        try:
+            publish_progress(project_id, "render_progress", 0, "Generating captions")
+            theme = resolve_theme(db, theme_id)
+            ass_content = generate_ass(MOCK_WORDS, theme, video_width=1080, video_height=1920)
+            
+            publish_progress(project_id, "render_progress", 10, "Rendering video")
+            output_path = project.original_video_path.replace('.mp4', '_captioned.mp4')
+            render_video_with_captions(
+                project.original_video_path,
+                ass_content,
+                output_path,
+                # Bare ticks, so clients get the binary progress frame;
+                # the phase message went out above
+                on_progress=lambda fraction: publish_progress(
+                    project_id, "render_progress", 10 + 89 * fraction
+                ),
+                # Known from transcription; saves an ffprobe run
+                duration=project.duration
+            )
+            
+            project.rendered_video_path = output_path
+            project.rendered_video_url = f"/uploads/{os.path.basename(output_path)}"
+            project.status = ProjectStatus.COMPLETED
+            db.commit()
+        except Exception as e:
+            # A failed flush/commit leaves the transaction unusable until
+            # rolled back, which would hide the error and skip the status
+            db.rollback()
+            project.status = ProjectStatus.ERROR
+            project.error_message = str(e)
+            db.commit()
+            publish_error(project_id, str(e))
+            publish_status_change(project_id, ProjectStatus.ERROR.value)
+            raise
+        
+        publish_progress(project_id, "render_progress", 100, "Render complete")
+        publish_status_change(project_id, ProjectStatus.COMPLETED.value)
+        
+        return {
+            "status": "completed",
+            "project_id": project_id,
+            "video_url": project.rendered_video_url,
+        }
+    finally:
+        db.close()
@@ -2,13 +2,64 @@
 Transcription Celery tasks.
 """
 
+from sqlalchemy import delete, insert
+
+from app.database import SessionLocal
+from app.models.project import Project, ProjectStatus
+from app.models.transcript import Transcript
+from app.services.events import publish_progress, publish_status_change, publish_error
+from app.services.transcription import transcribe_video
 from app.tasks.celery_app import celery_app
 
 
-@celery_app.task(bind=True)
-def transcribe_video_task(self, project_id: str, video_path: str, language: str = "en"):
+@celery_app.task(bind=True, acks_late=True)
+def transcribe_video_task(self, project_id: str, video_path: str, language: str = None):
     """
     Async task to transcribe a video.
+    
+    Progress and status changes are published for WebSocket clients.
     """
-    # Placeholder - will implement later
-    return {"status": "completed", "project_id": project_id}
+    db = SessionLocal()
+    try:
+        project = db.get(Project, project_id)
+        if not project:
+            return {"status": "error", "project_id": project_id, "message": "Project not found"}
+        
+        try:
+            publish_progress(project_id, "transcription_progress", 0, "Transcribing audio")
+            result = transcribe_video(
+                video_path,
+                language,
+                # Bare ticks, so clients get the binary progress frame;
+                # the phase message went out above
+                on_progress=lambda fraction: publish_progress(
+                    project_id, "transcription_progress", 99 * fraction
+                )
+            )
+            
+            db.execute(delete(Transcript).where(Transcript.project_id == project_id))
+            db.execute(insert(Transcript).values(
+                project_id=project_id,
+                language=result.language,
+                words_json=result.to_words(),
+            ))
+            project.duration = result.duration
+            project.status = ProjectStatus.TRANSCRIBED
+            db.commit()
+        except Exception as e:
+            # A failed flush/commit leaves the transaction unusable until
+            # rolled back, which would hide the error and skip the status
+            db.rollback()
+            project.status = ProjectStatus.ERROR
+            project.error_message = str(e)
+            db.commit()
+            publish_error(project_id, str(e))
+            publish_status_change(project_id, ProjectStatus.ERROR.value)
+            raise
+        
+        publish_progress(project_id, "transcription_progress", 100, "Transcription complete")
+        publish_status_change(project_id, ProjectStatus.TRANSCRIBED.value)
+        
+        return {"status": "completed", "project_id": project_id}
+    finally:
+        db.close()
@@ -4,17 +4,81 @@ Animation effects for ASS captions.
 Each animation function takes words and returns ASS-formatted text with animation tags.
 """
 
+from functools import lru_cache
 from typing import List
 from .utils import Word, escape_ass_text, hex_to_ass_color
 
 
+# Per-word tag templates, filled with str.format. Literal ASS braces are
+# doubled; everything that varies per word is a named field.
+KARAOKE_TEMPLATE = "{{\\kf{cs}}}{text}"
+KARAOKE_SWITCH_TEMPLATE = "{{\\k{cs}}}{text}"
+BOUNCE_TEMPLATE = (
+    "{{\\fscx80\\fscy80"
+    "\\t({t1},{t2},\\fscx110\\fscy110)"
+    "\\t({t2},{t3},\\fscx100\\fscy100)}}"
+    "{text}"
+)
+POP_TEMPLATE = (
+    "{{\\fscx0\\fscy0"
+    "\\t({t1},{t2},\\fscx120\\fscy120)"
+    "\\t({t2},{t3},\\fscx100\\fscy100)}}"
+    "{text}"
+)
+POP_SEQUENTIAL_TEMPLATE = (
+    "{{\\fscx0\\fscy0"
+    "\\t(0,{t1},\\fscx0\\fscy0)"            # Stay invisible until word time
+    "\\t({t1},{t2},\\fscx115\\fscy115)"     # Pop up
+    "\\t({t2},{t3},\\fscx100\\fscy100)}}"   # Settle
+    "{text}"
+)
+# Formatted twice, once per theme and then per word, so the theme fields
+# are single-braced and everything else is doubled once more
+GLOW_TEMPLATE = (
+    "{{{{\\blur0\\bord{bord}"
+    "\\t({{t1}},{{t2}},\\blur3\\bord{glow_bord}\\c{highlight})"
+    "\\t({{t2}},{{t3}},\\blur0\\bord{bord}\\c{color})}}}}"
+    "{{text}}"
+)
+WAVE_TEMPLATE = (
+    "{{\\fscy100"
+    "\\t({t1},{t2},\\fscy110)"
+    "\\t({t2},{t3},\\fscy100)}}"
+    "{text}"
+)
+TYPEWRITER_TEMPLATE = (
+    "{{\\alpha&HFF"
+    "\\t(0,{t1},\\alpha&HFF)"        # Stay invisible
+    "\\t({t1},{t2},\\alpha&H00)}}"   # Fade in
+    "{text}"
+)
+
+
+@lru_cache(maxsize=32)
+def _glow_template(outline_width: int, highlight_color: str, text_color: str) -> str:
+    """GLOW_TEMPLATE with a theme's border and colors filled in."""
+    return GLOW_TEMPLATE.format(
+        bord=outline_width,
+        glow_bord=outline_width + 2,
+        highlight=hex_to_ass_color(highlight_color),
+        color=hex_to_ass_color(text_color),
+    )
+
+
+def _word_texts(words: List[Word], theme) -> List[str]:
+    """Escaped display text for each word, uppercased if the theme says so."""
+    if theme.uppercase:
+        return [escape_ass_text(w.text).upper() for w in words]
+    return [escape_ass_text(w.text) for w in words]
+
+
 def no_animation(words: List[Word], theme) -> str:
     """
     No animation - just display text.
     
     Returns plain text without any animation effects.
     """
-    text = " ".join(escape_ass_text(w.text) for w in words)
+    text = " ".join([escape_ass_text(w.text) for w in words])
     if theme.uppercase:
         text = text.upper()
     return text
@@ -30,22 +94,14 @@ def karaoke_animation(words: List[Word], theme) -> str:
     Format: {\\k<duration>}word
     Duration is in centiseconds (1/100th of a second).
     """
-    parts = []
-    highlight_color = hex_to_ass_color(theme.highlight_color)
-    
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        # Calculate duration in centiseconds
-        duration_cs = word.duration_cs
-        
-        # Use \kf for smooth fill (karaoke fill)
-        # \k = instant switch, \kf = smooth fill, \ko = outline fill
-        parts.append(f"{{\\kf{duration_cs}}}{text}")
-    
-    return " ".join(parts)
+    # Use \kf for smooth fill (karaoke fill)
+    # \k = instant switch, \kf = smooth fill, \ko = outline fill
+    # Durations are Word.duration_cs, inlined to skip two property calls
+    fmt = KARAOKE_TEMPLATE.format
+    return " ".join([
+        fmt(cs=int((word.end - word.start) * 100), text=text)
+        for word, text in zip(words, _word_texts(words, theme))
+    ])
 
 
 def karaoke_word_highlight(words: List[Word], theme) -> str:
@@ -54,21 +110,12 @@ def karaoke_word_highlight(words: List[Word], theme) -> str:
     
     Each word starts in text_color and changes to highlight_color when spoken.
     """
-    parts = []
-    text_color = hex_to_ass_color(theme.text_color)
-    highlight_color = hex_to_ass_color(theme.highlight_color)
-    
-    for word in words:
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        duration_cs = word.duration_cs
-        
-        # Use \k for instant color switch
-        parts.append(f"{{\\k{duration_cs}}}{text}")
-    
-    return " ".join(parts)
+    # Use \k for instant color switch
+    fmt = KARAOKE_SWITCH_TEMPLATE.format
+    return " ".join([
+        fmt(cs=int((word.end - word.start) * 100), text=text)
+        for word, text in zip(words, _word_texts(words, theme))
+    ])
 
 
 def bounce_animation(words: List[Word], theme) -> str:
@@ -78,29 +125,23 @@ def bounce_animation(words: List[Word], theme) -> str:
     Each word moves up and slightly overshoots, then settles.
     Uses \\move and \\t (transform) tags.
     """
-    parts = []
-    
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        # Stagger the bounce for each word
-        delay = i * 50  # 50ms between each word
-        bounce_duration = 200  # bounce takes 200ms
-        
-        # Animation: start 30 pixels below, bounce up 10 pixels above target, settle
-        # \move(x1,y1,x2,y2,t1,t2) - move from (x1,y1) to (x2,y2) between t1 and t2 ms
-        # We'll use \t (transform) for the bounce effect instead
-        
-        # Scale bounce: start at 80%, go to 110%, settle at 100%
-        parts.append(
-            f"{{\\fscx80\\fscy80"
-            f"\\t({delay},{delay + bounce_duration},\\fscx110\\fscy110)"
-            f"\\t({delay + bounce_duration},{delay + bounce_duration + 100},\\fscx100\\fscy100)}}"
-            f"{text}"
-        )
+    # Stagger the bounce for each word: 50ms between words, the bounce
+    # takes 200ms and settles over 100ms.
+    # Scale bounce: start at 80%, go to 110%, settle at 100%
+    stagger = 50
+    bounce_duration = 200
+    settle_duration = 100
     
+    fmt = BOUNCE_TEMPLATE.format
+    parts = []
+    for i, text in enumerate(_word_texts(words, theme)):
+        delay = i * stagger
+        parts.append(fmt(
+            t1=delay,
+            t2=delay + bounce_duration,
+            t3=delay + bounce_duration + settle_duration,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -111,28 +152,20 @@ def pop_animation(words: List[Word], theme) -> str:
     Each word scales from 0% to 110% then settles at 100%.
     Creates a punchy, energetic feel.
     """
-    parts = []
-    
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        # Calculate when this word should pop based on timing
-        # We'll approximate based on word order
-        word_start_ms = int(word.start * 1000) if hasattr(word, 'start') else i * 200
-        
-        # Pop animation: 0% -> 120% -> 100%
-        pop_duration = 150
-        settle_duration = 100
-        
-        parts.append(
-            f"{{\\fscx0\\fscy0"
-            f"\\t({word_start_ms},{word_start_ms + pop_duration},\\fscx120\\fscy120)"
-            f"\\t({word_start_ms + pop_duration},{word_start_ms + pop_duration + settle_duration},\\fscx100\\fscy100)}}"
-            f"{text}"
-        )
+    # Pop animation: 0% -> 120% -> 100%, timed from each word's start
+    pop_duration = 150
+    settle_duration = 100
     
+    fmt = POP_TEMPLATE.format
+    parts = []
+    for word, text in zip(words, _word_texts(words, theme)):
+        word_start_ms = int(word.start * 1000)
+        parts.append(fmt(
+            t1=word_start_ms,
+            t2=word_start_ms + pop_duration,
+            t3=word_start_ms + pop_duration + settle_duration,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -142,31 +175,24 @@ def pop_sequential(words: List[Word], theme) -> str:
     
     Each word pops in when it's spoken.
     """
-    parts = []
-    
     # Get the line start time (first word start)
     line_start = words[0].start if words else 0
     
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
+    # Pop animation timing
+    pop_up = 100  # ms to scale up
+    settle = 80   # ms to settle
+    
+    fmt = POP_SEQUENTIAL_TEMPLATE.format
+    parts = []
+    for word, text in zip(words, _word_texts(words, theme)):
         # Time relative to line start (in milliseconds)
         relative_start_ms = int((word.start - line_start) * 1000)
-        
-        # Pop animation timing
-        pop_up = 100  # ms to scale up
-        settle = 80   # ms to settle
-        
-        parts.append(
-            f"{{\\fscx0\\fscy0"
-            f"\\t(0,{relative_start_ms},\\fscx0\\fscy0)"  # Stay invisible until word time
-            f"\\t({relative_start_ms},{relative_start_ms + pop_up},\\fscx115\\fscy115)"  # Pop up
-            f"\\t({relative_start_ms + pop_up},{relative_start_ms + pop_up + settle},\\fscx100\\fscy100)}}"  # Settle
-            f"{text}"
-        )
-    
+        parts.append(fmt(
+            t1=relative_start_ms,
+            t2=relative_start_ms + pop_up,
+            t3=relative_start_ms + pop_up + settle,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -176,28 +202,25 @@ def glow_animation(words: List[Word], theme) -> str:
     
     Uses blur and color transitions to create a glowing effect.
     """
-    parts = []
-    highlight_color = hex_to_ass_color(theme.highlight_color)
-    text_color = hex_to_ass_color(theme.text_color)
+    # Pulse timing
+    pulse_in = 150
+    pulse_out = 150
+    stagger = 100
     
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        # Pulse timing
-        pulse_in = 150
-        pulse_out = 150
-        delay = i * 100
-        
-        # Glow effect: increase border/blur, change color, then revert
-        parts.append(
-            f"{{\\blur0\\bord{theme.outline_width}"
-            f"\\t({delay},{delay + pulse_in},\\blur3\\bord{theme.outline_width + 2}\\c{highlight_color})"
-            f"\\t({delay + pulse_in},{delay + pulse_in + pulse_out},\\blur0\\bord{theme.outline_width}\\c{text_color})}}"
-            f"{text}"
-        )
+    # Glow effect: increase border/blur, change color, then revert
+    fmt = _glow_template(
+        theme.outline_width, theme.highlight_color, theme.text_color
+    ).format
     
+    parts = []
+    for i, text in enumerate(_word_texts(words, theme)):
+        delay = i * stagger
+        parts.append(fmt(
+            t1=delay,
+            t2=delay + pulse_in,
+            t3=delay + pulse_in + pulse_out,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -207,28 +230,22 @@ def wave_animation(words: List[Word], theme) -> str:
     
     Creates a wave motion across the text.
     """
-    parts = []
-    
-    for i, word in enumerate(words):
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
-        # Wave timing - offset for each word to create wave
-        wave_offset = i * 100  # ms offset between words
-        wave_up = 200
-        wave_down = 200
-        
-        # Use \frz (rotation) for a subtle wave, or \fry for 3D-ish effect
-        # Or use position offset with \pos override - but that's complex
-        # Let's use scale for a simpler wave effect
-        parts.append(
-            f"{{\\fscy100"
-            f"\\t({wave_offset},{wave_offset + wave_up},\\fscy110)"
-            f"\\t({wave_offset + wave_up},{wave_offset + wave_up + wave_down},\\fscy100)}}"
-            f"{text}"
-        )
+    # Wave timing - offset for each word to create wave
+    stagger = 100  # ms offset between words
+    wave_up = 200
+    wave_down = 200
     
+    # Scale (\fscy) gives a simpler wave than rotation or \pos offsets
+    fmt = WAVE_TEMPLATE.format
+    parts = []
+    for i, text in enumerate(_word_texts(words, theme)):
+        wave_offset = i * stagger
+        parts.append(fmt(
+            t1=wave_offset,
+            t2=wave_offset + wave_up,
+            t3=wave_offset + wave_up + wave_down,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -238,26 +255,20 @@ def typewriter_animation(words: List[Word], theme) -> str:
     
     Each word fades/appears when it's spoken.
     """
-    parts = []
     line_start = words[0].start if words else 0
+    fade_duration = 50  # Very quick fade in
     
-    for word in words:
-        text = escape_ass_text(word.text)
-        if theme.uppercase:
-            text = text.upper()
-        
+    # Alpha: FF = invisible, 00 = visible
+    fmt = TYPEWRITER_TEMPLATE.format
+    parts = []
+    for word, text in zip(words, _word_texts(words, theme)):
         # Time relative to line start
         relative_start_ms = int((word.start - line_start) * 1000)
-        fade_duration = 50  # Very quick fade in
-        
-        # Alpha: FF = invisible, 00 = visible
-        parts.append(
-            f"{{\\alpha&HFF"
-            f"\\t(0,{relative_start_ms},\\alpha&HFF)"  # Stay invisible
-            f"\\t({relative_start_ms},{relative_start_ms + fade_duration},\\alpha&H00)}}"  # Fade in
-            f"{text}"
-        )
-    
+        parts.append(fmt(
+            t1=relative_start_ms,
+            t2=relative_start_ms + fade_duration,
+            text=text,
+        ))
     return " ".join(parts)
 
 
@@ -276,6 +287,7 @@ ANIMATIONS = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_animation(style: str):
     """
     Get animation function by style name.
@@ -4,7 +4,8 @@ ASS (Advanced SubStation Alpha) subtitle file builder.
 Generates properly formatted ASS files with styles and dialogue.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, TextIO
 from .utils import (
     Word, 
     CaptionLine,
@@ -17,6 +18,53 @@ from .utils import (
 from .themes import Theme, AnimationStyle
 from .animations import get_animation
 
+# Theme fields that affect the generated Style line
+STYLE_FIELDS = (
+    "font_family",
+    "font_size",
+    "font_weight",
+    "text_color",
+    "highlight_color",
+    "outline_color",
+    "shadow_color",
+    "letter_spacing",
+    "outline_width",
+    "shadow_offset",
+    "alignment",
+    "position_y",
+)
+
+HEADER_TEMPLATE = """[Script Info]
+Title: {title}
+ScriptType: v4.00+
+WrapStyle: 0
+ScaledBorderAndShadow: yes
+YCbCr Matrix: TV.601
+PlayResX: {width}
+PlayResY: {height}
+"""
+
+STYLES_SECTION_HEADER = """
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding"""
+
+EVENTS_SECTION_HEADER = """
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"""
+
+# One V4+ Style line, in the Format order of the styles section. Fixed
+# columns are written in place: Italic/Underline/StrikeOut 0, ScaleX/Y
+# 100, Angle 0, BorderStyle 1 (outline + shadow; 3 = opaque box),
+# MarginL/R 20 and Encoding 1.
+STYLE_TEMPLATE = (
+    "Style: {name},{font},{size},"
+    "{primary},{secondary},{outline_color},{shadow_color},"
+    "{bold},0,0,0,"
+    "100,100,{spacing},0,"
+    "1,{outline},{shadow},"
+    "{alignment},20,20,{margin_v},1"
+)
+
 
 class ASSBuilder:
     """
@@ -38,15 +86,9 @@ class ASSBuilder:
     
     def build_header(self) -> str:
         """Generate the [Script Info] section."""
-        return f"""[Script Info]
-Title: {self.title}
-ScriptType: v4.00+
-WrapStyle: 0
-ScaledBorderAndShadow: yes
-YCbCr Matrix: TV.601
-PlayResX: {self.width}
-PlayResY: {self.height}
-"""
+        return HEADER_TEMPLATE.format(
+            title=self.title, width=self.width, height=self.height
+        )
     
     def build_style(self, theme: Theme, style_name: str = "Default") -> str:
         """
@@ -58,59 +100,28 @@ PlayResY: {self.height}
                ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow,
                Alignment, MarginL, MarginR, MarginV, Encoding
         """
-        # Colors in ASS format
-        primary_color = hex_to_ass_color(theme.text_color)  # Main text color
-        secondary_color = hex_to_ass_color(theme.highlight_color)  # Karaoke highlight
-        outline_color = hex_to_ass_color(theme.outline_color)
-        shadow_color = hex_to_ass_color(theme.shadow_color)
-        
-        # Font properties
-        bold = -1 if calculate_font_bold(theme.font_weight) else 0
-        italic = 0
-        underline = 0
-        strikeout = 0
-        
-        # Scale
-        scale_x = 100
-        scale_y = 100
-        
-        # Spacing
-        spacing = theme.letter_spacing
-        angle = 0
-        
-        # Border style: 1 = outline + shadow, 3 = opaque box
-        border_style = 1
-        outline = theme.outline_width
-        shadow = theme.shadow_offset
-        
-        # Alignment (numpad style)
-        alignment = alignment_to_ass(theme.alignment.value, theme.position_y)
-        
-        # Margins
-        margin_l = 20
-        margin_r = 20
-        margin_v = calculate_margin_v(theme.position_y, self.height)
-        
-        # Encoding (0 = ANSI)
-        encoding = 1
-        
-        return (
-            f"Style: {style_name},{theme.font_family},{theme.font_size},"
-            f"{primary_color},{secondary_color},{outline_color},{shadow_color},"
-            f"{bold},{italic},{underline},{strikeout},"
-            f"{scale_x},{scale_y},{spacing},{angle},"
-            f"{border_style},{outline},{shadow},"
-            f"{alignment},{margin_l},{margin_r},{margin_v},{encoding}"
+        return STYLE_TEMPLATE.format(
+            name=style_name,
+            font=theme.font_family,
+            size=theme.font_size,
+            # Main text color, then the karaoke highlight
+            primary=hex_to_ass_color(theme.text_color),
+            secondary=hex_to_ass_color(theme.highlight_color),
+            outline_color=hex_to_ass_color(theme.outline_color),
+            shadow_color=hex_to_ass_color(theme.shadow_color),
+            bold=-1 if calculate_font_bold(theme.font_weight) else 0,
+            spacing=theme.letter_spacing,
+            outline=theme.outline_width,
+            shadow=theme.shadow_offset,
+            # Numpad style
+            alignment=alignment_to_ass(theme.alignment.value, theme.position_y),
+            margin_v=calculate_margin_v(theme.position_y, self.height),
         )
     
     def build_styles_section(self) -> str:
         """Generate the [V4+ Styles] section."""
-        header = """
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding"""
-        
         styles = "\n".join(self.styles)
-        return f"{header}\n{styles}"
+        return f"{STYLES_SECTION_HEADER}\n{styles}"
     
     def add_style(self, theme: Theme, style_name: str = "Default"):
         """Add a style definition."""
@@ -157,12 +168,34 @@ Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour,
     
     def build_events_section(self) -> str:
         """Generate the [Events] section."""
-        header = """
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"""
-        
         dialogues = "\n".join(self.dialogues)
-        return f"{header}\n{dialogues}"
+        return f"{EVENTS_SECTION_HEADER}\n{dialogues}"
+    
+    def _iter_lines(self):
+        """
+        Every line of the file, in order, to be joined with newlines.
+        
+        An empty section still gets its blank line, as the section
+        builders above produce.
+        """
+        yield self.build_header()
+        yield STYLES_SECTION_HEADER
+        yield from self.styles or [""]
+        yield EVENTS_SECTION_HEADER
+        yield from self.dialogues or [""]
+    
+    def build_to(self, fp: TextIO):
+        """
+        Write the complete ASS file content to a text stream.
+        
+        Each line is written as it is, so the full file is never held in
+        memory as one string.
+        """
+        lines = self._iter_lines()
+        fp.write(next(lines))
+        for line in lines:
+            fp.write("\n")
+            fp.write(line)
     
     def build(self) -> str:
         """
@@ -171,18 +204,36 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"
         Returns:
             Complete ASS file as string
         """
-        parts = [
-            self.build_header(),
-            self.build_styles_section(),
-            self.build_events_section(),
-        ]
-        return "\n".join(parts)
+        # One flat join rather than joining each section and then the parts
+        return "\n".join(list(self._iter_lines()))
     
     def save(self, filepath: str):
         """Save ASS content to file."""
-        content = self.build()
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+            self.build_to(f)
+
+
+def build_ass_header(
+    theme: Theme,
+    video_width: int = 1920,
+    video_height: int = 1080,
+    title: str = "CaptionMagic"
+) -> str:
+    """
+    Build everything before the first Dialogue line for a single-style file.
+    
+    The result only depends on the theme's style fields and the canvas, so
+    it is cached and shared by every render with the same settings.
+    """
+    style_key = tuple((field, getattr(theme, field)) for field in STYLE_FIELDS)
+    return _cached_ass_header(style_key, video_width, video_height, title)
+
+
+@lru_cache(maxsize=64)
+def _cached_ass_header(style_key: tuple, video_width: int, video_height: int, title: str) -> str:
+    builder = ASSBuilder(width=video_width, height=video_height, title=title)
+    builder.add_style(Theme(name=title, **dict(style_key)), "Default")
+    return builder.build()
 
 
 def create_ass_from_lines(
@@ -205,9 +256,6 @@ def create_ass_from_lines(
     """
     builder = ASSBuilder(width=video_width, height=video_height)
     
-    # Add the main style
-    builder.add_style(theme, "Default")
-    
     # Get the animation function
     animation_func = get_animation(theme.animation_style)
     
@@ -224,7 +272,9 @@ def create_ass_from_lines(
             style="Default"
         )
     
-    return builder.build()
+    # Header and style come from the cache; only dialogue is per call
+    header = build_ass_header(theme, video_width, video_height, builder.title)
+    return header + "\n".join(builder.dialogues)
 
 
 def create_simple_ass(
@@ -250,7 +300,8 @@ def create_simple_ass(
         ASS file content
     """
     from .themes import get_theme
-    from .utils import group_words_into_lines, Word
+    from .utils import group_words_into_lines
+    from .generator import _normalize_words
     
     # Get theme
     theme = get_theme(theme_name)
@@ -262,15 +313,7 @@ def create_simple_ass(
         theme.max_chars_per_line = max_chars_per_line
     
     # Convert dicts to Word objects
-    word_objects = [
-        Word(
-            text=w['text'],
-            start=w['start'],
-            end=w['end'],
-            confidence=w.get('confidence', 1.0)
-        )
-        for w in words
-    ]
+    word_objects = _normalize_words(words)
     
     # Group into lines
     lines = group_words_into_lines(
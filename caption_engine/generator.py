@@ -5,7 +5,7 @@ This module provides the high-level API for generating captions.
 """
 
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .themes import Theme, get_theme, DEFAULT_THEMES, AnimationStyle
 from .utils import Word, CaptionLine, group_words_into_lines
@@ -176,59 +176,70 @@ def _resolve_theme(theme: Union[Theme, str, Dict[str, Any]]) -> Theme:
 
 
 def _normalize_words(words: Union[List[Word], List[Dict[str, Any]]]) -> List[Word]:
-    """Convert word dicts to Word objects."""
-    normalized = []
-    for w in words:
-        if isinstance(w, Word):
-            normalized.append(w)
-        elif isinstance(w, dict):
-            normalized.append(Word(
-                text=w['text'],
-                start=w['start'],
-                end=w['end'],
-                confidence=w.get('confidence', 1.0)
-            ))
-        else:
-            raise TypeError(f"Invalid word type: {type(w)}")
-    return normalized
+    """
+    Convert word dicts to Word objects.
+    
+    Word lists are all one type, so the first word picks the conversion
+    instead of checking every element.
+    """
+    if not words:
+        return []
+    first = words[0]
+    if isinstance(first, Word):
+        return list(words)
+    if isinstance(first, dict):
+        if 'confidence' in first:
+            # Transcripts carry a confidence on every word; subscripting
+            # beats .get() when the key is there
+            try:
+                return [
+                    Word(w['text'], w['start'], w['end'], w['confidence'])
+                    for w in words
+                ]
+            except KeyError:
+                pass
+        return [
+            Word(w['text'], w['start'], w['end'], w.get('confidence', 1.0))
+            for w in words
+        ]
+    raise TypeError(f"Invalid word type: {type(first)}")
 
 
 def _apply_config_overrides(theme: Theme, config: GeneratorConfig) -> Theme:
     """Apply configuration overrides to theme."""
-    # Create a copy to avoid modifying original
-    import copy
-    theme = copy.deepcopy(theme)
-    
-    if config.words_per_line is not None:
-        theme.words_per_line = config.words_per_line
-    if config.max_chars_per_line is not None:
-        theme.max_chars_per_line = config.max_chars_per_line
-    if config.animation_style is not None:
-        theme.animation_style = config.animation_style
-    if config.position_y is not None:
-        theme.position_y = config.position_y
-    
-    return theme
+    overrides = {
+        field: value
+        for field, value in (
+            ("words_per_line", config.words_per_line),
+            ("max_chars_per_line", config.max_chars_per_line),
+            ("animation_style", config.animation_style),
+            ("position_y", config.position_y),
+        )
+        if value is not None
+    }
+    if not overrides:
+        return theme
+    
+    # Themes only hold scalars, so replace() gives an independent copy
+    # without deepcopy's recursive walk
+    return replace(theme, **overrides)
 
 
 def _add_line_padding(lines: List[CaptionLine], padding: float) -> List[CaptionLine]:
     """Add time padding to lines to prevent abrupt cuts."""
     padded = []
-    for i, line in enumerate(lines):
-        # Create new words with padded timing
-        new_words = []
-        for j, word in enumerate(line.words):
-            new_word = Word(
-                text=word.text,
-                start=word.start - padding if j == 0 else word.start,
-                end=word.end + padding if j == len(line.words) - 1 else word.end,
-                confidence=word.confidence
+    for line in lines:
+        # Pad the first word's start (never below 0) and the last word's end
+        last = len(line.words) - 1
+        padded.append(CaptionLine(words=[
+            Word(
+                word.text,
+                max(0, word.start - padding if j == 0 else word.start),
+                word.end + padding if j == last else word.end,
+                word.confidence
             )
-            # Ensure start isn't negative
-            new_word.start = max(0, new_word.start)
-            new_words.append(new_word)
-        
-        padded.append(CaptionLine(words=new_words))
+            for j, word in enumerate(line.words)
+        ]))
     
     return padded
 
@@ -249,12 +260,10 @@ def generate_all_theme_previews(
     Returns:
         Dict mapping theme name to ASS content
     """
-    previews = {}
-    for name, theme in DEFAULT_THEMES.items():
-        previews[name] = preview_theme(
-            theme, sample_text, duration, video_width, video_height
-        )
-    return previews
+    return {
+        name: preview_theme(theme, sample_text, duration, video_width, video_height)
+        for name, theme in DEFAULT_THEMES.items()
+    }
 
 
 # =============================================================================
@@ -275,6 +284,24 @@ def validate_words(words: List[Dict[str, Any]]) -> List[str]:
         return errors
     
     required_fields = ['text', 'start', 'end']
+    
+    # Fast path: whole-list checks on plain columns. Only a list that
+    # fails one of them goes through the per-word loop for its messages.
+    try:
+        starts = [w['start'] for w in words]
+        ends = [w['end'] for w in words]
+        has_text = all('text' in w for w in words)
+    except (KeyError, TypeError):
+        # Malformed entries; the loop below reports them
+        has_text = False
+    if (
+        has_text
+        and min(starts) >= 0
+        and all(end >= start for start, end in zip(starts, ends))
+        and all(start >= prev_end - 0.1 for start, prev_end in zip(starts[1:], ends))
+    ):
+        return errors
+    
     prev_end = 0
     
     for i, word in enumerate(words):
@@ -24,6 +24,19 @@ class Alignment(str, Enum):
     RIGHT = "right"
 
 
+# Enum members by value, for from_dict
+ALIGNMENTS = {member.value: member for member in Alignment}
+ANIMATION_STYLES = {member.value: member for member in AnimationStyle}
+
+
+def _enum_member(members: dict, enum_cls, value: str):
+    """Look up an enum member by value, raising ValueError like the enum call."""
+    try:
+        return members[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
 @dataclass
 class Theme:
     """Caption theme configuration."""
@@ -83,11 +96,11 @@ class Theme:
             "background_color": self.background_color,
             "position_x": self.position_x,
             "position_y": self.position_y,
-            "alignment": self.alignment.value,
+            "alignment": self.alignment,
             "outline_width": self.outline_width,
             "shadow_offset": self.shadow_offset,
             "shadow_blur": self.shadow_blur,
-            "animation_style": self.animation_style.value,
+            "animation_style": self.animation_style,
             "animation_speed": self.animation_speed,
             "words_per_line": self.words_per_line,
             "max_chars_per_line": self.max_chars_per_line,
@@ -99,11 +112,13 @@ class Theme:
     @classmethod
     def from_dict(cls, data: dict) -> "Theme":
         """Create theme from dictionary."""
-        # Handle enum conversions
+        # Handle enum conversions (plain dict lookups, not Enum.__call__)
         if "alignment" in data and isinstance(data["alignment"], str):
-            data["alignment"] = Alignment(data["alignment"])
+            data["alignment"] = _enum_member(ALIGNMENTS, Alignment, data["alignment"])
         if "animation_style" in data and isinstance(data["animation_style"], str):
-            data["animation_style"] = AnimationStyle(data["animation_style"])
+            data["animation_style"] = _enum_member(
+                ANIMATION_STYLES, AnimationStyle, data["animation_style"]
+            )
         return cls(**data)
 
 
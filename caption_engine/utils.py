@@ -2,11 +2,14 @@
 Utility functions for caption generation.
 """
 
+from bisect import bisect_right
 from typing import List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     """A single word with timing information."""
     text: str
@@ -25,7 +28,7 @@ class Word:
         return int(self.duration * 100)
 
 
-@dataclass 
+@dataclass(slots=True)
 class CaptionLine:
     """A line of caption containing multiple words."""
     words: List[Word]
@@ -51,6 +54,11 @@ class CaptionLine:
         return self.end - self.start
 
 
+# Every two-digit uppercase hex byte, "00" to "FF"
+HEX_BYTES = frozenset(f"{i:02X}" for i in range(256))
+
+
+@lru_cache(maxsize=256)
 def hex_to_ass_color(hex_color: str) -> str:
     """
     Convert hex color to ASS color format.
@@ -79,13 +87,17 @@ def hex_to_ass_color(hex_color: str) -> str:
     if len(hex_color) == 3:
         hex_color = ''.join(c * 2 for c in hex_color)
     
-    # Parse RGB values
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    # The output digits are the input's, reordered and uppercased, so
+    # each pair is only checked against the table instead of parsed
+    hex_color = hex_color.upper()
+    r = hex_color[0:2]
+    g = hex_color[2:4]
+    b = hex_color[4:6]
+    if r not in HEX_BYTES or g not in HEX_BYTES or b not in HEX_BYTES:
+        raise ValueError(f"Invalid hex color: #{hex_color}")
     
     # ASS uses BGR order
-    return f"&H00{b:02X}{g:02X}{r:02X}"
+    return f"&H00{b}{g}{r}"
 
 
 def ass_color_to_hex(ass_color: str) -> str:
@@ -112,6 +124,10 @@ def ass_color_to_hex(ass_color: str) -> str:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+# Zero-padded "00" to "99", for timestamp fields
+TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+
 def seconds_to_ass_time(seconds: float) -> str:
     """
     Convert seconds to ASS timestamp format.
@@ -130,12 +146,14 @@ def seconds_to_ass_time(seconds: float) -> str:
         >>> seconds_to_ass_time(3723.45)
         '1:02:03.45'
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    centisecs = int((seconds % 1) * 100)
-    
-    return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
+    # Round once to whole centiseconds, then split with integer math;
+    # float modulo could land just under a boundary (0.29 -> .28)
+    centisecs = int(seconds * 100 + 0.5)
+    secs, centisecs = divmod(centisecs, 100)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    return f"{hours}:{TWO_DIGITS[minutes]}:{TWO_DIGITS[secs]}.{TWO_DIGITS[centisecs]}"
 
 
 def ass_time_to_seconds(ass_time: str) -> float:
@@ -158,6 +176,12 @@ def ass_time_to_seconds(ass_time: str) -> float:
     return hours * 3600 + minutes * 60 + secs + centisecs / 100
 
 
+# Numpad alignments, top row first, for alignment_to_ass
+ALIGNMENT_GRID = (7, 8, 9, 4, 5, 6, 1, 2, 3)
+HORIZONTAL_INDEX = {'left': 0, 'center': 1, 'right': 2}
+
+
+@lru_cache(maxsize=64)
 def alignment_to_ass(alignment: str, position_y: int) -> int:
     """
     Convert alignment and vertical position to ASS alignment number.
@@ -174,23 +198,10 @@ def alignment_to_ass(alignment: str, position_y: int) -> int:
     Returns:
         ASS alignment number (1-9)
     """
-    # Determine vertical position
-    if position_y < 33:
-        v_offset = 6  # Top row (7, 8, 9)
-    elif position_y < 66:
-        v_offset = 3  # Middle row (4, 5, 6)
-    else:
-        v_offset = 0  # Bottom row (1, 2, 3)
-    
-    # Determine horizontal alignment
-    if alignment == 'left':
-        h_base = 1
-    elif alignment == 'right':
-        h_base = 3
-    else:  # center
-        h_base = 2
-    
-    return v_offset + h_base
+    # Row: top below 33%, middle below 66%, else bottom. Unknown
+    # alignments fall back to center.
+    row = (position_y >= 33) + (position_y >= 66)
+    return ALIGNMENT_GRID[row * 3 + HORIZONTAL_INDEX.get(alignment, 1)]
 
 
 def position_to_pixels(
@@ -216,6 +227,16 @@ def position_to_pixels(
     return x, y
 
 
+# ASS special characters, escaped in one translate() pass
+ASS_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '{': '\\{',
+    '}': '\\}',
+    '\n': '\\N',
+})
+
+
+@lru_cache(maxsize=4096)  # Transcripts reuse a small vocabulary
 def escape_ass_text(text: str) -> str:
     """
     Escape special characters for ASS format.
@@ -226,12 +247,7 @@ def escape_ass_text(text: str) -> str:
     Returns:
         Escaped text safe for ASS
     """
-    # ASS special characters
-    text = text.replace('\\', '\\\\')
-    text = text.replace('{', '\\{')
-    text = text.replace('}', '\\}')
-    text = text.replace('\n', '\\N')
-    return text
+    return text.translate(ASS_ESCAPES)
 
 
 def group_words_into_lines(
@@ -255,32 +271,45 @@ def group_words_into_lines(
     if not words:
         return []
     
-    lines = []
-    current_words = []
-    current_chars = 0
-    
-    for word in words:
-        word_len = len(word.text)
-        
-        # Check if adding this word would exceed limits
-        would_exceed_words = len(current_words) >= words_per_line
-        would_exceed_chars = current_chars + word_len + 1 > max_chars_per_line  # +1 for space
-        
-        # Start new line if limits exceeded (and we have words)
-        if current_words and (would_exceed_words or would_exceed_chars):
-            lines.append(CaptionLine(words=current_words))
-            current_words = []
-            current_chars = 0
-        
-        # Add word to current line
-        current_words.append(word)
-        current_chars += word_len + 1  # +1 for space
-    
-    # Don't forget last line
-    if current_words:
-        lines.append(CaptionLine(words=current_words))
-    
-    return lines
+    # Break on a plain column of lengths, then slice the lines out,
+    # instead of appending word by word
+    breaks = find_line_breaks(
+        [len(word.text) for word in words], words_per_line, max_chars_per_line
+    )
+    bounds = [0, *breaks, len(words)]
+    return [
+        CaptionLine(words=words[start:end])
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def find_line_breaks(
+    char_lens: List[int],
+    words_per_line: int,
+    max_chars_per_line: int
+) -> List[int]:
+    """
+    Index of the first word of every line after the first.
+    
+    A line ends before the word that would take it past words_per_line
+    words or max_chars_per_line characters (counting a space after each
+    word); a line always gets at least one word.
+    """
+    # cum[k] is the width of the first k words, a space after each
+    cum = [0, *accumulate(char_len + 1 for char_len in char_lens)]
+    total = len(char_lens)
+    breaks = []
+    line_start = 0
+    while True:
+        # Words that fit the character limit, found by bisecting the
+        # prefix sums, then capped at words_per_line
+        fits = bisect_right(cum, cum[line_start] + max_chars_per_line) - 1
+        line_end = max(min(fits, line_start + words_per_line), line_start + 1)
+        if line_end >= total:
+            break
+        breaks.append(line_end)
+        line_start = line_end
+    return breaks
 
 
 def calculate_font_bold(weight: int) -> bool:
@@ -288,6 +317,7 @@ def calculate_font_bold(weight: int) -> bool:
     return weight >= 700
 
 
+@lru_cache(maxsize=64)
 def calculate_margin_v(position_y: int, video_height: int) -> int:
     """
     Calculate vertical margin for ASS positioning.
@@ -3,6 +3,18 @@
 import { useEffect, useRef, useCallback, useState } from 'react'
 import { WSMessage } from '@/types'
 
+// Bare progress updates arrive as 5-byte binary frames:
+// uint8 type tag + little-endian float32 progress
+const PROGRESS_TYPES: WSMessage['type'][] = ['transcription_progress', 'render_progress']
+
+function decodeProgressFrame(buffer: ArrayBuffer): WSMessage {
+  const view = new DataView(buffer)
+  return {
+    type: PROGRESS_TYPES[view.getUint8(0)],
+    data: { progress: view.getFloat32(1, true) },
+  }
+}
+
 interface UseWebSocketOptions {
   onMessage?: (message: WSMessage) => void
   onOpen?: () => void
@@ -52,6 +64,7 @@ export function useWebSocket(
 
     const wsUrl = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000'
     ws.current = new WebSocket(`${wsUrl}/api/v1/ws/${projectId}`)
+    ws.current.binaryType = 'arraybuffer'
 
     ws.current.onopen = () => {
       setIsConnected(true)
@@ -61,7 +74,9 @@ export function useWebSocket(
 
     ws.current.onmessage = (event) => {
       try {
-        const message: WSMessage = JSON.parse(event.data)
+        const message: WSMessage = event.data instanceof ArrayBuffer
+          ? decodeProgressFrame(event.data)
+          : JSON.parse(event.data)
         setLastMessage(message)
         onMessage?.(message)
       } catch (err) {